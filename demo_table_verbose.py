@@ -22,6 +22,20 @@ print(s)
 s = table_verbose(table, header=header, str_align=["left", "right"], edge_line=True, number_align=True, table_format="html", vertical_padding=0)
 print(s)
 
+print("bytes output test")
+import copy
+for table_format in ["pretty_ascii", "fancy_grid", "markdown", "html"]:
+    for encoding in ["utf-8", "utf-16-le", "latin-1"]:
+        if table_format == "fancy_grid" and encoding == "latin-1":
+            continue
+        s = table_verbose(copy.deepcopy(table), header=copy.deepcopy(header), number_align=True, table_format=table_format)
+        b = table_verbose(copy.deepcopy(table), header=copy.deepcopy(header), number_align=True, table_format=table_format, encoding=encoding)
+        assert b == s.encode(encoding)
+    s = table_verbose(copy.deepcopy(table), header=copy.deepcopy(header), number_align=True, table_format=table_format)
+    b = table_verbose(copy.deepcopy(table), header=copy.deepcopy(header), number_align=True, table_format=table_format, as_bytes=True)
+    assert b == s.encode("utf-8")
+print(b.decode("utf-8"))
+
 print("np.array test")
 import numpy as np
 import pandas as pd
@@ -475,7 +475,14 @@ def table_verbose(table,
                   edge_line=True,
                   padding=0,
                   vertical_padding=0,
+                  encoding=None,
+                  as_bytes=False,
                   ):
+    # with an encoding (or as_bytes=True, meaning utf-8) the finished table
+    # is encoded once and returned as bytes
+    if as_bytes and encoding is None:
+        encoding = "utf-8"
+
     if isinstance(table, DataFrame):
         if header is None:
             header = list(table.columns)
@@ -486,8 +493,9 @@ def table_verbose(table,
     formatter = TableFormatter[table_format]
 
     if not isinstance(formatter, TableFormat):
-        return formatter(table, header, str_align, number_align,
-                         restrict_float, edge_line, padding, vertical_padding)
+        s = formatter(table, header, str_align, number_align,
+                      restrict_float, edge_line, padding, vertical_padding)
+        return s if encoding is None else s.encode(encoding)
 
     padding = max(formatter.force_padding, padding)
 
@@ -565,4 +573,5 @@ def table_verbose(table,
     if formatter.end_note is not None:
         str_list.append(formatter.end_note)
 
-    return "\n".join(str_list)
+    s = "\n".join(str_list)
+    return s if encoding is None else s.encode(encoding)